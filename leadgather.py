@@ -1,9 +1,41 @@
 # network_monitor.py - Use this to find API calls
 import browser_cookie3
 import json
+import os
+import re
+import tempfile
+import time
 
-def get_browser_cookies():
-    """Extract cookies from browser for authentication"""
+COOKIE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'leadgather', 'cookies.json')
+COOKIE_CACHE_TTL = 30 * 60  # seconds
+
+_HEADER_RE = re.compile(r"-H '([^:]+): ([^']+)'")
+_URL_RE = re.compile(r"curl ['\"]?([^ '\"]+)['\"]?")
+
+def _load_cached_cookies():
+    """Return cached cookies if the cache file is younger than the TTL"""
+    try:
+        if time.time() - os.path.getmtime(COOKIE_CACHE_FILE) > COOKIE_CACHE_TTL:
+            return None
+        with open(COOKIE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_cached_cookies(cookie_dict):
+    """Atomically write cookies to the cache file"""
+    cache_dir = os.path.dirname(COOKIE_CACHE_FILE)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cookie_dict, f)
+        os.replace(tmp_path, COOKIE_CACHE_FILE)
+    except OSError:
+        print("Could not write cookie cache")
+
+def _extract_browser_cookies():
+    """Extract cookies from the browser cookie store"""
     try:
         # Try Chrome first
         cookies = browser_cookie3.chrome(domain_name='bizbuysell.com')
@@ -21,6 +53,20 @@ def get_browser_cookies():
             print("Could not extract browser cookies")
             return {}
 
+def get_browser_cookies(force: bool = False):
+    """Extract cookies from browser for authentication, using the disk cache when fresh"""
+    if not force:
+        cookie_dict = _load_cached_cookies()
+        if cookie_dict is not None:
+            print(f"Loaded {len(cookie_dict)} cookies from cache")
+            return cookie_dict
+    
+    cookie_dict = _extract_browser_cookies()
+    # Don't cache a failed extraction so the next call retries the browser
+    if cookie_dict:
+        _save_cached_cookies(cookie_dict)
+    return cookie_dict
+
 def analyze_network_traffic():
     """
     Instructions for manual API discovery:
@@ -51,19 +97,15 @@ def analyze_network_traffic():
 # Example cURL to Python converter
 def curl_to_python(curl_command: str):
     """Convert cURL command to Python requests code"""
-    import re
-    
     # Parse headers
     headers = {}
-    header_pattern = r"-H '([^:]+): ([^']+)'"
-    headers_match = re.findall(header_pattern, curl_command)
+    headers_match = _HEADER_RE.findall(curl_command)
     
     for name, value in headers_match:
         headers[name.strip()] = value.strip()
     
     # Parse URL
-    url_pattern = r"curl ['\"]?([^ '\"]+)['\"]?"
-    url_match = re.search(url_pattern, curl_command)
+    url_match = _URL_RE.search(curl_command)
     
     if url_match:
         url = url_match.group(1)